@@ -2,6 +2,7 @@ import os
 import sys
 import tempfile
 import argparse
+from pathlib import Path
 from general_utils import utils
 from md_utils.simulation import gmx_utils, gmx_parser
 
@@ -75,7 +76,7 @@ def main():
 
     # Count the currently available number of groups
     if args.ndx:
-        groups, group_str = gmx_parser.parse_ndx(args.ndx)
+        groups, group_str = gmx_parser.parse_ndx_headers(args.ndx)
     else:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_ndx = os.path.join(temp_dir, "temp.ndx")
@@ -84,34 +85,35 @@ def main():
                 '-f', args.gro,
                 '-o', temp_ndx
             ], print_output=False, prompt_input='q\n')
-            groups, group_str = gmx_parser.parse_ndx(temp_ndx)
+            groups, group_str = gmx_parser.parse_ndx_headers(temp_ndx)
 
     n_groups = len(groups)  # Current number of groups
     print(f"Current index groups ({n_groups}):")
     print(group_str)
 
     print(f"\nNow creating GROMACS index groups from selections in {args.selections}...")
-    with open(args.selections, 'r') as f:
-        selections = f.readlines()
+    selections = Path(args.selections).read_text().splitlines()
 
-    prompt_input = ''
+    prompt_lines = []
     for selection in selections:
-        if not selection.strip() or selection.strip().startswith('#'):
-            print(f"Skipping line: {selection.strip()}")
-            continue
         selection = selection.strip()
         if not selection or selection.startswith('#'):
+            print(f"Skipping line: {selection}")
             continue
-        sel_str, grp_name = selection.split('#')
+        sel_str, _, grp_name = selection.partition('#')  # Only the first '#' separates the group name
         sel_str = sel_str.strip()
         grp_name = grp_name.strip()
+        if not grp_name:
+            raise ValueError(f"No group name specified for the selection: {selection}")
         n_groups += 1
-        prompt_input += f"{sel_str}\nname {n_groups-1} {grp_name}\n"  # Note that the index starts from 0
+        prompt_lines.append(sel_str)
+        prompt_lines.append(f"name {n_groups-1} {grp_name}")  # Note that the index starts from 0
 
-    prompt_input += 'q\n'
+    prompt_lines.append('q')
+    prompt_input = '\n'.join(prompt_lines) + '\n'
     print(f"Prompt input for make_ndx:\n{prompt_input}")
     returncode, stdout = gmx_utils.run_gmx_cmd(gmx_args, prompt_input=prompt_input, print_output=False)
 
-    new_groups, new_group_str = gmx_parser.parse_ndx(args.output)
+    new_groups, new_group_str = gmx_parser.parse_ndx_headers(args.output)
     print(f"Current index groups ({len(new_groups)}):")
     print(new_group_str)
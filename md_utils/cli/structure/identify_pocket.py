@@ -3,7 +3,9 @@ import sys
 import time
 import argparse
 import warnings
+import numpy as np
 import MDAnalysis as mda
+from MDAnalysis.lib.distances import capped_distance
 from general_utils import utils
 
 
@@ -56,21 +58,28 @@ def main():
     u = mda.Universe(args.input)
 
     ligand = u.select_atoms(f"resname {args.resname}")
-    pocket = u.select_atoms(f"protein and around {args.cutoff} group ligand", ligand=ligand)
     if len(ligand.residues) == 0:
         warnings.warn("No pocket identification will be performed as no residues with the specified ligand resname were found. Please check the input file and ligand resname.")  # noqa: E501
     else:
-        if len(pocket.residues) == 0:
+        # Grid-based neighbor search between the ligand and protein atoms. As in "protein and around", the
+        # ligand atoms themselves are excluded from the search, in case they are also protein atoms.
+        protein = u.select_atoms("protein and not group ligand", ligand=ligand)
+        pairs = capped_distance(ligand.positions, protein.positions, max_cutoff=args.cutoff, box=u.dimensions,
+                                return_distances=False)
+        pocket = protein[np.unique(pairs[:, 1])]
+        residues = pocket.residues
+        if len(residues) == 0:
             print("No pocket residues found within the specified cutoff distance.")
         else:
-            print(f"List of pocket residues ({len(pocket.residues)}):")
-            for i in pocket.residues:
-                print(f"  {i.resname} {i.resid}")
+            resids = residues.resids.astype(str).tolist()
+            print(f"List of pocket residues ({len(residues)}):")
+            for resname, resid in zip(residues.resnames, resids):
+                print(f"  {resname} {resid}")
 
-            pymol_selection = f"select pocket, resi {'+'.join([str(i.resid) for i in pocket.residues])}"
-            residues = " ".join([str(i.resid) for i in pocket.residues])
-            ndx_selection = f'a N CA C O & r {residues}'
-            vmd_selection = f"resid {' '.join([str(i.resid) for i in pocket.residues])}"
+            pymol_selection = f"select pocket, resi {'+'.join(resids)}"
+            resid_str = " ".join(resids)
+            ndx_selection = f'a N CA C O & r {resid_str}'
+            vmd_selection = f"resid {resid_str}"
 
             print(f"\n- PyMOL selection:\n{pymol_selection}")
             print(f"\n- GROMACS index file selection:\n{ndx_selection}")
@@ -2,6 +2,7 @@ import os
 import sys
 import time
 import argparse
+import numpy as np
 from general_utils import utils
 from md_utils.structure import protein
 from pymol import cmd
@@ -59,38 +60,28 @@ def main():
     cmd.load(args.input, "structure")
     model = cmd.get_model(f"structure and ss {args.ss_type} and name CA")  # Use CA atoms to get one entry per residue
 
+    atoms = model.atom
+    if len(atoms) == 0:
+        print(f"No residues with secondary structure type {args.ss_type} were found in {args.input}.")
+        print(f"Elapsed time: {utils.format_time(time.time() - t1)}")
+        return
+
+    resi = np.fromiter((a.resi_number for a in atoms), dtype=int, count=len(atoms))  # resi_number is resi as an int
+    chains = np.array([a.chain for a in atoms])
+
+    # A new segment starts wherever the residue numbering is not consecutive or the chain changes
+    breaks = np.flatnonzero((np.diff(resi) != 1) | (chains[1:] != chains[:-1])) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(atoms)])) - 1
+    lengths = resi[ends] - resi[starts] + 1
+
     segment_dict = {}  # A dictionary to store segments for each chain, e.g., {"A": [("A10", "K20"), ("T30", "A35")], "B": [...]}  # noqa: E501
-    for i, a in enumerate(model.atom):
-        res = f"{protein.convert_res_code(a.resn)}{a.resi}"
-        chain = a.chain
-        if chain not in segment_dict:
-            segment_dict[chain] = []
-        if i == 0:
-            start_res = res
-            prev_resi = int(a.resi)
-        else:
-            curr_resi = int(a.resi)
-            if curr_resi == prev_resi + 1:
-                prev_resi = curr_resi
-            else:
-                # New segment
-                end_res = f"{protein.convert_res_code(model.atom[i-1].resn)}{model.atom[i-1].resi}"
-                segment_dict[model.atom[i-1].chain].append((start_res, end_res))
-                start_res = res
-                prev_resi = curr_resi
-
-    end_res = f"{protein.convert_res_code(model.atom[-1].resn)}{model.atom[-1].resi}"
-    segment_dict[chain].append((start_res, end_res))
-
-    # Filter segments by minimum length
-    for chain in segment_dict:
-        filtered_segments = []
-        for start, end in segment_dict[chain]:
-            start_idx = int(''.join(filter(str.isdigit, start)))
-            end_idx = int(''.join(filter(str.isdigit, end)))
-            if (end_idx - start_idx + 1) >= args.min_length:
-                filtered_segments.append((start, end))
-        segment_dict[chain] = filtered_segments
+    for start, end, length in zip(starts, ends, lengths):
+        segments = segment_dict.setdefault(atoms[start].chain, [])
+        if length >= args.min_length:  # Filter segments by minimum length
+            start_res = f"{protein.three_to_one(atoms[start].resn)}{atoms[start].resi}"
+            end_res = f"{protein.three_to_one(atoms[end].resn)}{atoms[end].resi}"
+            segments.append((start_res, end_res))
 
     for chain, segments in segment_dict.items():
         print(f"Chain {chain}:")
@@ -1,10 +1,43 @@
 import os
 import re
-import six
 import warnings
+import numpy as np
+from pathlib import Path
 from collections import OrderedDict
 
 
+# A "[ name ]" group header of a GROMACS index file, shared by parse_ndx and parse_ndx_headers.
+# Headers never span lines, so that parse_ndx_headers can stream the file.
+_NDX_HEADER = re.compile(r'\[[ \t]*([^\]\n]+?)[ \t]*\]')
+_NDX_HEADER_BYTES = re.compile(_NDX_HEADER.pattern.encode())
+
+
+def _format_groups(n_atoms):
+    """
+    Format the names and sizes of index groups the way :code:`gmx make_ndx` lists them.
+
+    Parameters
+    ----------
+    n_atoms : dict
+        A dictionary (in file order) where keys are group names and values are the numbers of atoms in the groups.
+
+    Returns
+    -------
+    group_str : str
+        A string representation of the groups for easy viewing.
+    """
+    name_w = max((len(name) for name in n_atoms), default=0)
+    label_w = name_w + 1
+    count_w = len(str(max(n_atoms.values(), default=0)))
+    idx_w = len(str(len(n_atoms) - 1))
+
+    fmt = f"  {{:<{idx_w + 2}}} {{:<{label_w}}} {{:>{count_w}}} atoms\n".format  # widths are fixed once here
+    lines = [fmt(f"({i})", f"{name}:", n) for i, (name, n) in enumerate(n_atoms.items())]
+    group_str = ''.join(lines)
+
+    return group_str
+
+
 def parse_ndx(ndx_file):
     """
     Parse a GROMACS index (.ndx) file and return a dictionary of groups.
@@ -17,35 +50,81 @@ def parse_ndx(ndx_file):
     Returns
     -------
     groups : dict
-        An ordered dictionary where keys are group names and values are lists of atom indices.
+        A dictionary (in file order) where keys are group names and values are NumPy arrays (int32) of atom indices.
     group_str : str
         A string representation of the groups for easy viewing.
     """
-    groups = OrderedDict()
-    current_group = None
-    with open(ndx_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('[') and line.endswith(']'):
-                current_group = line[1:-1].strip()
-                groups[current_group] = []
-            elif current_group is not None:
-                indices = line.split()
-                groups[current_group].extend(int(idx) for idx in indices)
-
-    name_w = max((len(name) for name in groups), default=0)
-    label_w = name_w + 1
-    count_w = len(str(max((len(atoms) for atoms in groups.values()), default=0)))
-    idx_w = len(str(len(groups) - 1))
+    data = Path(ndx_file).read_text()
 
-    group_str = ''
-    for i, (name, atoms) in enumerate(groups.items()):
-        label = f"{name}:"
-        group_str += f"  ({i}) {'':<{idx_w - len(str(i))}}{label:<{label_w}} {len(atoms):>{count_w}} atoms\n"
+    # Splitting with a capturing group gives ['<preamble>', name_1, body_1, name_2, body_2, ...]
+    sections = _NDX_HEADER.split(data)
+
+    groups = {}
+    for name, body in zip(sections[1::2], sections[2::2]):
+        # Note that np.fromstring returns [0] rather than an empty array for a whitespace-only body
+        groups[name] = np.empty(0, dtype=np.int32) if body.isspace() else np.fromstring(body, sep=' ', dtype=np.int32)
+
+    group_str = _format_groups({name: len(atoms) for name, atoms in groups.items()})
 
     return groups, group_str
 
 
+def parse_ndx_headers(ndx_file, chunk_size=1 << 20):
+    """
+    Parse only the group names and sizes of a GROMACS index (.ndx) file. This is faster than
+    :code:`parse_ndx` and its peak memory is only a few times :code:`chunk_size`, as the file is read
+    in binary chunks and the atom indices are only counted with NumPy, never stored or converted to integers.
+
+    Parameters
+    ----------
+    ndx_file : str
+        Path to the GROMACS index file.
+    chunk_size : int, Optional
+        The number of bytes to read at a time. The default is 1 MiB.
+
+    Returns
+    -------
+    n_atoms : dict
+        A dictionary (in file order) where keys are group names and values are the numbers of atoms in the groups.
+    group_str : str
+        A string representation of the groups for easy viewing, identical to the one returned by :code:`parse_ndx`.
+    """
+    n_atoms = {}
+    name = None
+    tail = b''
+    with open(ndx_file, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            chunk = tail + data
+            # Only whole lines are processed so that no header or atom index is split between two chunks
+            cut = chunk.rfind(b'\n') + 1 if data else len(chunk)
+            chunk, tail = chunk[:cut], chunk[cut:]
+
+            headers = list(_NDX_HEADER_BYTES.finditer(chunk))
+            is_token = np.frombuffer(chunk, dtype=np.uint8) > ord(' ')  # i.e., not whitespace
+            for m in headers:
+                is_token[m.start():m.end()] = False  # header text is not counted as atom indices
+            token_start = is_token.copy()
+            token_start[1:] &= ~is_token[:-1]
+
+            pos = 0
+            for m in headers:
+                if name is not None:
+                    n_atoms[name] += int(np.count_nonzero(token_start[pos:m.start()]))
+                name = m.group(1).decode()
+                n_atoms[name] = 0
+                pos = m.end()
+            if name is not None:
+                n_atoms[name] += int(np.count_nonzero(token_start[pos:]))
+
+            if not data:
+                break
+
+    group_str = _format_groups(n_atoms)
+
+    return n_atoms, group_str
+
+
 class ParseError(Exception):
     """Error raised during parsing a file."""
 
@@ -71,10 +150,8 @@ class MDP(OrderedDict):
 
     Attributes
     ----------
-    COMMENT : :code:`re.Pattern` object
-        A compiled regular expression pattern for comments in MDP files.
-    PARAMETER : :code:`re.Pattern` object
-        A compiled regular expression pattern for parameters in MDP files.
+    LINE : :code:`re.Pattern` object
+        A compiled regular expression pattern matching either a comment or a parameter line in MDP files.
     input_mdp : str
         The real path of the input MDP file returned by :code:`os.path.realpath(input_mdp)`,
         which resolves any symbolic links in the path.
@@ -86,8 +163,7 @@ class MDP(OrderedDict):
     MDP([('C0001', 'em.mdp - used as input into grompp to generate em.tpr'), ('C0002', 'All unspecified parameters adopt their own default values.'), ('B0001', ''), ('C0003', 'Run Control'), ('integrator', 'steep'), ('nsteps', 500000), ('B0002', ''), ('C0004', 'Energy minnimization'), ('emtol', 100.0), ('emstep', 0.01), ('B0003', ''), ('C0005', 'Neighbor searching/Electrostatics/Van der Waals'), ('cutoff-scheme', 'Verlet'), ('nstlist', 10), ('ns_type', 'grid'), ('pbc', 'xyz'), ('coulombtype', 'PME'), ('rcoulomb', 1.0), ('rvdw', 1.0)])  # noqa: E501
     """
     # Below are some class variables accessible to all functions.
-    COMMENT = re.compile("""\s*;\s*(?P<value>.*)""")  # noqa: W605
-    PARAMETER = re.compile("""\s*(?P<parameter>[^=]+?)\s*=\s*(?P<value>[^;]*)(?P<comment>\s*;.*)?""", re.VERBOSE)  # noqa: W605, E501
+    LINE = re.compile(r";\s*(?P<comment>.*)|(?P<parameter>[^=]+?)\s*=\s*(?P<value>[^;]*)(?:;.*)?")
 
     def __init__(self, input_mdp=None, **kwargs):
         super(MDP, self).__init__(**kwargs)  # can use kwargs to set dict! (but no sanity checks!)
@@ -115,15 +191,22 @@ class MDP(OrderedDict):
         """
         if type(s) is not str:
             return s
-        for converter in int, float, str:  # try them in increasing order of lenience
+        s = s.strip()
+        if ' ' not in s and '\t' not in s:  # fast path for the common case of a single value
+            for converter in int, float:
+                try:
+                    return converter(s)
+                except ValueError:
+                    pass
+            return s
+
+        values = s.split()
+        for converter in int, float:  # try them in increasing order of lenience
             try:
-                s = [converter(i) for i in s.split()]
-                if len(s) == 1:
-                    return s[0]
-                else:
-                    return s
-            except (ValueError, AttributeError):
+                return [converter(i) for i in values]
+            except ValueError:
                 pass
+        return values
 
     def read(self):
         """
@@ -137,27 +220,22 @@ class MDP(OrderedDict):
 
         data = OrderedDict()
         iblank = icomment = 0
-        with open(self.input_mdp) as mdp:
-            for line in mdp:
-                line = line.strip()
-                if len(line) == 0:
-                    iblank += 1
-                    data[BLANK(iblank)] = ""
-                    continue
-                m = self.COMMENT.match(line)
-                if m:
-                    icomment += 1
-                    data[COMMENT(icomment)] = m.group("value")
-                    continue
+        for line in Path(self.input_mdp).read_text().splitlines():
+            line = line.strip()
+            if len(line) == 0:
+                iblank += 1
+                data[BLANK(iblank)] = ""
+                continue
 
-                m = self.PARAMETER.match(line)
-                if m:
-                    parameter = m.group("parameter")
-                    value = self._convert_to_numeric(m.group("value"))
-                    data[parameter] = value
-                else:
-                    err_msg = f"{os.path.basename(self.input_mdp)!r}: unknown line in mdp file, {line!r}"
-                    raise ParseError(err_msg)
+            m = self.LINE.fullmatch(line)
+            if m is None:
+                err_msg = f"{os.path.basename(self.input_mdp)!r}: unknown line in mdp file, {line!r}"
+                raise ParseError(err_msg)
+            if m.group("parameter") is None:
+                icomment += 1
+                data[COMMENT(icomment)] = m.group("comment")
+            else:
+                data[m.group("parameter")] = self._convert_to_numeric(m.group("value"))
 
         super(MDP, self).update(data)
 
@@ -180,16 +258,19 @@ class MDP(OrderedDict):
         if output_mdp is None:
             output_mdp = self.input_mdp
 
+        lines = []
+        for k, v in self.items():
+            if k[0] == "B":  # blank line
+                lines.append("\n")
+            elif k[0] == "C":  # comment
+                lines.append(f"; {v!s}\n")
+            else:  # parameter = value
+                if skipempty and (v == "" or v is None):
+                    continue
+                if isinstance(v, str) or not hasattr(v, "__iter__"):
+                    lines.append(f"{k!s} = {v!s}\n")
+                else:
+                    lines.append(f"{k} = {' '.join(map(str, v))}\n")
+
         with open(output_mdp, "w") as mdp:
-            for k, v in self.items():
-                if k[0] == "B":  # blank line
-                    mdp.write("\n")
-                elif k[0] == "C":  # comment
-                    mdp.write(f"; {v!s}\n")
-                else:  # parameter = value
-                    if skipempty and (v == "" or v is None):
-                        continue
-                    if isinstance(v, six.string_types) or not hasattr(v, "__iter__"):
-                        mdp.write(f"{k!s} = {v!s}\n")
-                    else:
-                        mdp.write(f"{k} = {' '.join(map(str, v))}\n")
+            mdp.write(''.join(lines))
@@ -0,0 +1,183 @@
+"""
+Unit tests for the module gmx_parser.py.
+"""
+import os
+import pytest
+import numpy as np
+from md_utils import data
+from md_utils.simulation import gmx_parser
+
+NDX = """[ System ]
+   1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+  16   17
+[ Protein ]
+   1    2    3
+[ empty ]
+
+[ Water_and_ions ]
+  16   17
+"""
+
+
+def test_parse_ndx(tmp_path):
+    ndx_file = tmp_path / "index.ndx"
+    ndx_file.write_text(NDX)
+    groups, group_str = gmx_parser.parse_ndx(ndx_file)
+
+    assert list(groups) == ['System', 'Protein', 'empty', 'Water_and_ions']
+    np.testing.assert_array_equal(groups['System'], np.arange(1, 18))
+    np.testing.assert_array_equal(groups['Protein'], [1, 2, 3])
+    np.testing.assert_array_equal(groups['Water_and_ions'], [16, 17])
+    assert all(atoms.dtype == np.int32 for atoms in groups.values())
+
+    # An empty group must give an empty array rather than [0]
+    assert groups['empty'].shape == (0,)
+
+    assert group_str == (
+        "  (0) System:         17 atoms\n"
+        "  (1) Protein:         3 atoms\n"
+        "  (2) empty:           0 atoms\n"
+        "  (3) Water_and_ions:  2 atoms\n"
+    )
+
+
+def test_parse_ndx_empty_last_group(tmp_path):
+    # A header at the very end of the file leaves an empty ('') rather than a whitespace-only body
+    ndx_file = tmp_path / "index.ndx"
+    ndx_file.write_text("[ System ]\n1 2\n[ empty ]")
+    groups, _ = gmx_parser.parse_ndx(ndx_file)
+
+    np.testing.assert_array_equal(groups['System'], [1, 2])
+    assert groups['empty'].shape == (0,)
+
+
+def test_parse_ndx_headers(tmp_path):
+    ndx_file = tmp_path / "index.ndx"
+    ndx_file.write_text(NDX)
+    groups, group_str = gmx_parser.parse_ndx(ndx_file)
+    for chunk_size in [1, 10, 1 << 20]:  # chunks may end in the middle of a line
+        n_atoms, headers_str = gmx_parser.parse_ndx_headers(ndx_file, chunk_size=chunk_size)
+
+        assert n_atoms == {name: len(atoms) for name, atoms in groups.items()}
+        assert headers_str == group_str
+
+
+EM_MDP_ITEMS = [
+    ('C0001', 'em.mdp - used as input into grompp to generate em.tpr'),
+    ('C0002', 'All unspecified parameters adopt their own default values.'),
+    ('B0001', ''),
+    ('C0003', 'Run Control'),
+    ('integrator', 'steep'),
+    ('nsteps', 500000),
+    ('B0002', ''),
+    ('C0004', 'Energy minnimization'),
+    ('emtol', 100.0),
+    ('emstep', 0.01),
+    ('B0003', ''),
+    ('C0005', 'Neighbor searching/Electrostatics/Van der Waals'),
+    ('cutoff-scheme', 'Verlet'),
+    ('nstlist', 10),
+    ('ns_type', 'grid'),
+    ('pbc', 'xyz'),
+    ('coulombtype', 'PME'),
+    ('rcoulomb', 1.2),
+    ('rvdw', 1.2),
+]
+
+
+def test_mdp_read_write_em(tmp_path):
+    mdp = gmx_parser.MDP(os.path.join(data.mdp_dir, 'em.mdp'))
+    assert list(mdp.items()) == EM_MDP_ITEMS
+
+    # Inline comments are dropped and "parameter = value" is written with single spaces
+    output_mdp = tmp_path / "em.mdp"
+    mdp.write(output_mdp)
+    assert output_mdp.read_text() == (
+        "; em.mdp - used as input into grompp to generate em.tpr\n"
+        "; All unspecified parameters adopt their own default values.\n"
+        "\n"
+        "; Run Control\n"
+        "integrator = steep\n"
+        "nsteps = 500000\n"
+        "\n"
+        "; Energy minnimization\n"
+        "emtol = 100.0\n"
+        "emstep = 0.01\n"
+        "\n"
+        "; Neighbor searching/Electrostatics/Van der Waals\n"
+        "cutoff-scheme = Verlet\n"
+        "nstlist = 10\n"
+        "ns_type = grid\n"
+        "pbc = xyz\n"
+        "coulombtype = PME\n"
+        "rcoulomb = 1.2\n"
+        "rvdw = 1.2\n"
+    )
+
+
+@pytest.mark.parametrize('mdp_name', ['em.mdp', 'ions.mdp', 'nvt_equil.mdp', 'npt_equil.mdp', 'md.mdp'])
+def test_mdp_round_trip(tmp_path, mdp_name):
+    mdp = gmx_parser.MDP(os.path.join(data.mdp_dir, mdp_name))
+    output_mdp = tmp_path / mdp_name
+    mdp.write(output_mdp)
+    mdp_rewritten = gmx_parser.MDP(output_mdp)
+
+    assert list(mdp_rewritten.items()) == list(mdp.items())
+
+    output_mdp_2 = tmp_path / f"rewritten_{mdp_name}"
+    mdp_rewritten.write(output_mdp_2)
+    assert output_mdp_2.read_text() == output_mdp.read_text()
+
+
+def test_mdp_values(tmp_path):
+    input_mdp = tmp_path / "test.mdp"
+    input_mdp.write_text(
+        "; gen-seed = 6722267; commented-out parameter\n"
+        "define =\n"
+        "integrator = md   ; inline comment\n"
+        "dt = 0.002;no space before the comment\n"
+        "tc_grps = Protein Non-Protein\n"
+        "tau_t = 0.1 0.1 ; one value per group\n"
+        "ref_t = 300 300\n"
+        "annealing-time = 0 1.5\n"
+    )
+    mdp = gmx_parser.MDP(input_mdp)
+
+    assert list(mdp.items()) == [
+        ('C0001', 'gen-seed = 6722267; commented-out parameter'),
+        ('define', ''),
+        ('integrator', 'md'),
+        ('dt', 0.002),
+        ('tc_grps', ['Protein', 'Non-Protein']),
+        ('tau_t', [0.1, 0.1]),
+        ('ref_t', [300, 300]),
+        ('annealing-time', [0.0, 1.5]),
+    ]
+
+    output_mdp = tmp_path / "output.mdp"
+    mdp.write(output_mdp)
+    assert output_mdp.read_text().splitlines()[1:3] == ["define = ", "integrator = md"]
+
+    mdp.write(output_mdp, skipempty=True)
+    assert "define" not in output_mdp.read_text()
+    assert "tc_grps = Protein Non-Protein\n" in output_mdp.read_text()
+
+
+def test_mdp_unknown_line(tmp_path):
+    input_mdp = tmp_path / "test.mdp"
+    input_mdp.write_text("integrator = md\nnot a parameter\n")
+    with pytest.raises(gmx_parser.ParseError, match="unknown line in mdp file, 'not a parameter'"):
+        gmx_parser.MDP(input_mdp)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 20])
+def test_parse_ndx_headers_irregular(tmp_path, chunk_size):
+    # Indices before the first header are ignored and headers may share a line with indices
+    ndx_file = tmp_path / "index.ndx"
+    ndx_file.write_text("7 8\n[System]\n1 2 3 [ Protein ] 1\n2 [ empty ][ last ]4\n\n5")
+    groups, group_str = gmx_parser.parse_ndx(ndx_file)
+    n_atoms, headers_str = gmx_parser.parse_ndx_headers(ndx_file, chunk_size=chunk_size)
+
+    assert n_atoms == {'System': 3, 'Protein': 2, 'empty': 0, 'last': 2}
+    assert n_atoms == {name: len(atoms) for name, atoms in groups.items()}
+    assert headers_str == group_str